@@ -3,16 +3,86 @@ Panda3D Racing Game - Main Entry Point
 With enhanced procedural terrain and shadows
 """
 import argparse
+import functools
 import json
+import os
+import re
 from pathlib import Path
 
 from direct.showbase.ShowBase import ShowBase
 from direct.task import Task
 from direct.gui.OnscreenText import OnscreenText
-from panda3d.core import *
+from panda3d.core import (
+    AmbientLight,
+    AntialiasAttrib,
+    DirectionalLight,
+    Fog,
+    Geom,
+    GeomNode,
+    GeomTriangles,
+    GeomVertexArrayFormat,
+    GeomVertexData,
+    GeomVertexFormat,
+    GeomVertexReader,
+    RescaleNormalAttrib,
+    TextNode,
+    Vec3,
+    WindowProperties,
+)
 import math
 import sys
-import random
+import zlib
+
+import numpy as np
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Bound once for the per-frame camera math (skips the `math.` attribute lookup).
+_sin = math.sin
+_cos = math.cos
+_sqrt = math.sqrt
+_atan2 = math.atan2
+_radians = math.radians
+
+
+def _derive_orbit(dx: float, dy: float, dz: float):
+    """Return (distance, yaw, pitch) of an orbit camera offset (dx, dy, dz) from its target."""
+    horiz = _sqrt(dx * dx + dy * dy)
+    return _sqrt(horiz * horiz + dz * dz), _atan2(-dx, -dy), _atan2(dz, horiz)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_json_file(path: str, mtime_ns: int, size: int):
+    """Parse a JSON file; keyed on mtime and size so edits made by the editor are picked up."""
+    if _orjson is not None:
+        with open(path, "rb") as f:
+            return _orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _read_json(path) -> object:
+    """Load a JSON config through the parse cache. Callers must treat the result as read-only."""
+    path = os.fspath(path)
+    st = os.stat(path)
+    return _parse_json_file(path, st.st_mtime_ns, st.st_size)
+
+
+_RESOLUTION_RE = re.compile(r"^\s*(\d+)\s*x\s*(\d+)\s*$", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_resolution(text: str, *, default: tuple[int, int]) -> tuple[int, int]:
+    """Parse "WIDTHxHEIGHT" (case-insensitive, spaces allowed); `default` if invalid."""
+    m = _RESOLUTION_RE.match(text or "")
+    if m:
+        w, h = int(m.group(1)), int(m.group(2))
+        if w > 0 and h > 0:
+            return w, h
+    return int(default[0]), int(default[1])
 
 # Import our vehicle systems
 from src.business.vehicle_entity import VehicleEntity
@@ -33,6 +103,18 @@ PROJECT_ROOT = Path(__file__).resolve().parent
 
 class RacingGame(ShowBase):
     """Main game class with enhanced terrain and shadows"""
+
+    # Driving controls: (control, keys, value on press, value on release).
+    _KEY_BINDINGS = (
+        ("throttle", ("w", "arrow_up"), 1.0, 0.0),
+        ("brake", ("s", "arrow_down"), 1.0, 0.0),
+        ("steering", ("a", "arrow_left"), -1.0, 0.0),
+        ("steering", ("d", "arrow_right"), 1.0, 0.0),
+        ("handbrake", ("space",), True, False),
+    )
+
+    # HUD gear labels for the usual gear range; others fall back to formatting.
+    _GEAR_TEXT = {-1: "Gear: R", 0: "Gear: N", **{g: f"Gear: {g}" for g in range(1, 9)}}
     
     def __init__(
         self,
@@ -50,6 +132,37 @@ class RacingGame(ShowBase):
         # For racing games, the default 200x200 terrain is too small.
         self.terrain_world_scale = 10.0
 
+        # Procedural cylinder meshes keyed by shape, shared across wheels.
+        self._cylinder_geoms = {}
+        # Cylinder vertices: float32 position + int8 normal padded to 4 bytes
+        # (16-byte rows instead of 24 for V3N3). Normals are stored scaled by
+        # 127; the shader-generated lighting renormalizes them.
+        cyl_array = GeomVertexArrayFormat()
+        cyl_array.addColumn("vertex", 3, Geom.NTFloat32, Geom.CPoint)
+        cyl_array.addColumn("normal", 4, Geom.NTInt8, Geom.CNormal)
+        self._cylinder_vformat = GeomVertexFormat.registerFormat(GeomVertexFormat(cyl_array))
+        self._cylinder_vdtype = np.dtype([("vertex", "<f4", 3), ("normal", "i1", 4)])
+        # One loaded `box` model; boxes are cheap copyTo() clones sharing its Geom.
+        self._box_proto = self.loader.loadModel("box")
+        self._box_proto.clearModelNodes()
+        # The same box as a template for baked prop batches (_build_box_batch):
+        # its 24 corners, triangle indices and render state (noise texture).
+        box_geom_np = self._box_proto.find("**/+GeomNode")
+        box_geom = box_geom_np.node().getGeom(0).decompose()
+        box_vdata = box_geom.getVertexData()
+        self._box_batch_vdtype = np.dtype(
+            [("vertex", "<f4", 3), ("normal", "<f4", 3), ("color", "u1", 4), ("texcoord", "<f4", 2)]
+        )
+        self._box_template = np.zeros(box_vdata.getNumRows(), dtype=self._box_batch_vdtype)
+        for column, getter in (("vertex", "getData3"), ("normal", "getData3"), ("texcoord", "getData2")):
+            reader = GeomVertexReader(box_vdata, column)
+            self._box_template[column] = [tuple(getattr(reader, getter)()) for _ in range(box_vdata.getNumRows())]
+        box_prim = box_geom.getPrimitive(0)
+        self._box_template_tris = np.array(
+            [box_prim.getVertex(i) for i in range(box_prim.getNumVertices())], dtype=np.int64
+        )
+        self._box_state = box_geom_np.getState().compose(box_geom_np.node().getGeomState(0))
+
         # CLI selections / flags
         self.vehicle_config_id = (vehicle_config_id or "").strip()
         self.map_config_id = (map_config_id or "").strip()
@@ -62,19 +175,13 @@ class RacingGame(ShowBase):
         
         # Setup display
         props = WindowProperties()
-        w, h = self._parse_resolution(resolution, default=(1280, 720))
+        w, h = _parse_resolution(resolution, default=(1280, 720))
         props.setSize(int(w), int(h))
         if fullscreen:
             props.setFullscreen(True)
         props.setTitle("Panda3D Racing Game - Enhanced Terrain")
         self.win.requestProperties(props)
         
-        # Enable advanced rendering
-        self.render.setShaderAuto()
-
-        # Let Panda3D pick a reasonable AA mode when available.
-        self.render.setAntialias(AntialiasAttrib.MAuto)
-        
         # Initialize game world
         self.world = GameWorld()
         
@@ -232,8 +339,10 @@ class RacingGame(ShowBase):
         """Setup lighting with shadows"""
         # Ambient light (sky color)
         self.amblight = AmbientLight("ambient_light")
-        # Keep ambient lower so shadows remain visible.
-        self.amblight.setColor((0.22, 0.24, 0.27, 1))
+        # Keep ambient lower so shadows remain visible. This already includes
+        # the cool fill term (0.12, 0.13, 0.15): ambient lights simply add, so
+        # one light gives the same result with one fewer shader input.
+        self.amblight.setColor((0.34, 0.37, 0.42, 1))
         self.ambient_np = self.render.attachNewNode(self.amblight)
         self.render.setLight(self.ambient_np)
         
@@ -257,89 +366,94 @@ class RacingGame(ShowBase):
         
         # Setup shadow mapping
         # Use a higher-res shadow map for crisper vehicle shadows.
-        if bool(getattr(self, "enable_shadows", True)):
+        if self.enable_shadows:
             self.sun_light.setShadowCaster(True, int(self.shadow_map_resolution), int(self.shadow_map_resolution))
+            self._setup_shadow_projection()
             self._apply_shadow_focus(Vec3(0.0, 0.0, self.shadow_target_height))
         else:
             self.sun_np.setPos(60, -60, 120)
             self.sun_np.lookAt(0, 0, 0)
         
-        # Fill light (warmer)
-        fill_light = AmbientLight("fill_light")
-        fill_light.setColor((0.12, 0.13, 0.15, 1))
-        fill_np = self.render.attachNewNode(fill_light)
-        self.render.setLight(fill_np)
-        
-        # Rim light for better definition
-        rim_light = DirectionalLight("rim_light")
-        rim_light.setColor((0.3, 0.35, 0.4, 0.6))
-        rim_light.setDirection((0.3, 0.5, -0.3))
-        rim_np = self.render.attachNewNode(rim_light)
-        self.render.setLight(rim_np)
-
-        # Re-apply auto shader after lights are configured (ensures shadow variant).
+        # Rim light for better definition; skipped in the low-end (no shadows)
+        # setup where its subtle contribution isn't worth another light.
+        if self.enable_shadows:
+            rim_light = DirectionalLight("rim_light")
+            rim_light.setColor((0.3, 0.35, 0.4, 0.6))
+            rim_light.setDirection((0.3, 0.5, -0.3))
+            rim_np = self.render.attachNewNode(rim_light)
+            self.render.setLight(rim_np)
+
+        # Enable the auto shader once, after the lights (and shadow caster) are
+        # configured. Terrain, props and the vehicle inherit it from render.
         self.render.setShaderAuto()
         
         print(f"Lighting: Multi-light setup ({'shadows on' if self.enable_shadows else 'shadows off'})")
 
-    def _apply_shadow_focus(self, target: Vec3) -> None:
-        if not bool(getattr(self, "enable_shadows", True)):
-            return
-        if not hasattr(self, "sun_np") or not hasattr(self, "sun_light"):
-            return
-
-        direction = Vec3(getattr(self, "_sun_shadow_dir", Vec3(-1.0, 1.0, -2.0)))
-        if direction.length_squared() < 1e-8:
-            direction = Vec3(-1.0, 1.0, -2.0)
-        direction.normalize()
+    def _setup_shadow_projection(self) -> None:
+        """Precompute the light-space snapping basis and configure the shadow lens.
 
-        focus_size = float(getattr(self, "shadow_focus_size", 220.0))
-        shadow_map_resolution = max(1, int(getattr(self, "shadow_map_resolution", 2048)))
-        texel_world = focus_size / float(shadow_map_resolution)
-
-        snap_target = Vec3(target)
-        if texel_world > 1e-6:
-            up_ref = Vec3(0.0, 0.0, 1.0)
-            if abs(direction.dot(up_ref)) > 0.98:
-                up_ref = Vec3(0.0, 1.0, 0.0)
-
-            right = direction.cross(up_ref)
-            if right.length_squared() < 1e-8:
-                right = Vec3(1.0, 0.0, 0.0)
-            right.normalize()
-
-            up = right.cross(direction)
-            if up.length_squared() < 1e-8:
-                up = Vec3(0.0, 0.0, 1.0)
-            up.normalize()
+        The sun direction, focus size and clip planes are fixed after init, so
+        the per-frame `_apply_shadow_focus` only has to project and snap.
+        """
+        direction = self._sun_shadow_dir
+        up_ref = Vec3(0.0, 0.0, 1.0)
+        if abs(direction.dot(up_ref)) > 0.98:
+            up_ref = Vec3(0.0, 1.0, 0.0)
+
+        right = direction.cross(up_ref)
+        if right.length_squared() < 1e-8:
+            right = Vec3(1.0, 0.0, 0.0)
+        right.normalize()
+
+        up = right.cross(direction)
+        if up.length_squared() < 1e-8:
+            up = Vec3(0.0, 0.0, 1.0)
+        up.normalize()
+
+        self._shadow_right = right
+        self._shadow_up = up
+        self._shadow_texel = self.shadow_focus_size / float(max(1, int(self.shadow_map_resolution)))
+        self._shadow_texel_sq = self._shadow_texel * self._shadow_texel
+        self._shadow_offset = direction * self.shadow_light_distance
+        self._shadow_last_aim = None
+        self._last_shadow_anchor = Vec3(1e30, 1e30, 1e30)
 
-            right_proj = snap_target.dot(right)
-            up_proj = snap_target.dot(up)
-            right_snap = round(right_proj / texel_world) * texel_world
-            up_snap = round(up_proj / texel_world) * texel_world
+        lens = self.sun_light.getLens()
+        if lens is not None:
+            far_plane = max(self.shadow_far, self.shadow_near + 1.0)
+            lens.setFilmSize(self.shadow_focus_size, self.shadow_focus_size)
+            lens.setNearFar(self.shadow_near, far_plane)
 
-            snap_target += right * (right_snap - right_proj)
-            snap_target += up * (up_snap - up_proj)
+    def _apply_shadow_focus(self, target: Vec3) -> None:
+        right = self._shadow_right
+        up = self._shadow_up
+        texel = self._shadow_texel
+
+        right_proj = target.dot(right)
+        up_proj = target.dot(up)
+        snap_target = (
+            target
+            + right * (round(right_proj / texel) * texel - right_proj)
+            + up * (round(up_proj / texel) * texel - up_proj)
+        )
 
-        light_distance = float(getattr(self, "shadow_light_distance", 320.0))
-        light_pos = snap_target - direction * light_distance
-        self.sun_np.setPos(light_pos)
-        self.sun_np.lookAt(snap_target)
+        # The snapped target only moves in whole texels, so most frames leave
+        # the light where it is.
+        if snap_target != self._shadow_last_aim:
+            self._shadow_last_aim = snap_target
+            self.sun_np.setPos(snap_target - self._shadow_offset)
+            self.sun_np.lookAt(snap_target)
 
-        lens = self.sun_light.getLens()
-        if lens is not None:
-            lens.setFilmSize(focus_size, focus_size)
-            near_plane = float(getattr(self, "shadow_near", 5.0))
-            far_plane = float(getattr(self, "shadow_far", light_distance + 400.0))
-            if far_plane <= near_plane + 1.0:
-                far_plane = near_plane + 1.0
-            lens.setNearFar(near_plane, far_plane)
-
-    def _update_shadow_focus(self, state) -> None:
-        if not bool(getattr(self, "enable_shadows", True)):
+    def _update_shadow_focus(self, state, follow=None) -> None:
+        if not self.enable_shadows:
             return
-        anchor, _ = self._get_camera_follow_anchor(state)
-        target = Vec3(float(anchor.x), float(anchor.y), float(anchor.z) + float(getattr(self, "shadow_target_height", 2.0)))
+        anchor, _ = follow if follow is not None else self._get_camera_follow_anchor(state)
+        # Movement below one shadow texel would snap back onto the same grid
+        # cell, so skip the projection until the anchor has moved at least that far.
+        if (anchor - self._last_shadow_anchor).length_squared() < self._shadow_texel_sq:
+            return
+        self._last_shadow_anchor = Vec3(anchor)
+        target = Vec3(anchor.x, anchor.y, anchor.z + self.shadow_target_height)
         self._apply_shadow_focus(target)
     
     def setup_terrain(self):
@@ -420,11 +534,19 @@ class RacingGame(ShowBase):
             try:
                 baked_mesh_path = PROJECT_ROOT / str(baked_mesh_rel)
                 if baked_mesh_path.exists():
-                    terrain_node = self.loader.loadModel(str(baked_mesh_path))
-                    terrain_node.reparentTo(self.render)
-                    print(f"Terrain: loaded baked mesh {baked_mesh_rel}")
+                    # Stream the baked mesh in the background; sampling uses the
+                    # heightmap, so the rest of startup does not wait on it.
+                    terrain_node = self.render.attachNewNode("terrain")
+                    self.loader.loadModel(
+                        str(baked_mesh_path),
+                        callback=self._on_baked_terrain_loaded,
+                        extraArgs=[str(baked_mesh_rel)],
+                        blocking=False,
+                    )
             except Exception as e:
                 print(f"Terrain: failed to load baked mesh ({e}), fallback to runtime build")
+                if terrain_node is not None:
+                    terrain_node.removeNode()
                 terrain_node = None
 
         if terrain_node is None:
@@ -433,10 +555,21 @@ class RacingGame(ShowBase):
         self.terrain_node = terrain_node
         self.terrain_node.setPos(0, 0, 0)
         self.terrain_node.setTwoSided(False)
-        self.terrain_node.setShaderAuto()
+        # Antialiasing is scoped to the terrain, track and vehicle; the
+        # decorative props render without it.
+        self.terrain_node.setAntialias(AntialiasAttrib.MAuto)
         
         print(f"Terrain: {self.terrain.map_width}x{self.terrain.map_height} with enhanced colors")
 
+    def _on_baked_terrain_loaded(self, model, baked_mesh_rel: str) -> None:
+        """Attach the asynchronously loaded baked terrain mesh (runtime build on failure)."""
+        if model is None:
+            print(f"Terrain: failed to load baked mesh {baked_mesh_rel}, fallback to runtime build")
+            self.terrain.build(self.terrain_node)
+            return
+        model.reparentTo(self.terrain_node)
+        print(f"Terrain: loaded baked mesh {baked_mesh_rel}")
+
     def setup_track(self):
         """Setup track runtime geometry if a map config is selected."""
         selected = getattr(self, "_selected_map", None)
@@ -474,6 +607,7 @@ class RacingGame(ShowBase):
 
             self.runtime_track = RuntimeTrack(track_cfg, self.terrain)
             self.track_node = self.runtime_track.build(self.render)
+            self.track_node.setAntialias(AntialiasAttrib.MAuto)
 
             start_pos, start_heading = self.runtime_track.get_start_pose()
             self._spawn_player_at(start_pos, start_heading)
@@ -509,7 +643,9 @@ class RacingGame(ShowBase):
     
     def add_environment_props(self):
         """Add trees and rocks to the scene"""
-        self.env_props = []
+        # All props are static boxes, so they are baked straight into one Geom
+        # (one vertex buffer, one draw call) under a single root.
+        self.env_props_root = self.render.attachNewNode("env_props")
 
         scale = float(self.terrain_world_scale)
 
@@ -547,75 +683,103 @@ class RacingGame(ShowBase):
         rock_size_min = float(rocks_size[0])
         rock_size_max = float(rocks_size[1])
         
+        # Draw every random value for a prop type in one batch, then drop the
+        # ones inside the center exclusion rectangle (track) with a mask. The
+        # generator is seeded from the map id (crc32 is stable across runs,
+        # unlike hash()), so a map always gets the same layout.
+        rng = np.random.default_rng(zlib.crc32(self.map_config_id.encode("utf-8")))
+
         # Add random rocks
-        for i in range(max(0, rocks_count)):
-            angle = random.uniform(0, 2 * math.pi)
-            radius = random.uniform(rocks_min_r * scale, rocks_max_r * scale)
-            x = math.cos(angle) * radius
-            y = math.sin(angle) * radius
-            
-            # Skip center area (track)
-            if abs(x) < rocks_excl_w and abs(y) < rocks_excl_l:
-                continue
-            
-            # Create rock
-            rock = self.loader.loadModel("box")
-            rscale = random.uniform(rock_size_min, rock_size_max)
-            rock.setScale(rscale, rscale, rscale * 0.6)
-            rock.setPos(x, y, 0.5)
-            
-            # Color rocks grey-brown
-            rock_color = (random.uniform(0.55, 0.65), 
-                         random.uniform(0.52, 0.60), 
-                         random.uniform(0.48, 0.55), 1)
-            rock.setColor(rock_color)
-            rock.setTwoSided(True)
-            rock.reparentTo(self.render)
-            self.env_props.append(rock)
-        
-        # Add random trees (simplified as cones)
-        for i in range(max(0, trees_count)):
-            angle = random.uniform(0, 2 * math.pi)
-            radius = random.uniform(trees_min_r * scale, trees_max_r * scale)
-            x = math.cos(angle) * radius
-            y = math.sin(angle) * radius
-            
-            # Skip center area
-            if abs(x) < trees_excl_w and abs(y) < trees_excl_l:
-                continue
-            
-            # Tree trunk
-            trunk = self.loader.loadModel("box")
-            trunk.setScale(0.8, 0.8, 3.0)
-            trunk.setPos(x, y, 1.5)
-            trunk.setColor(0.35, 0.25, 0.15, 1)
-            trunk.setTwoSided(True)
-            trunk.reparentTo(self.render)
-            self.env_props.append(trunk)
-            
-            # Tree foliage (cone approximation with box)
-            foliage = self.loader.loadModel("box")
-            foliage.setScale(3.5, 3.5, 4.0)
-            foliage.setPos(x, y, 5.0)
-            foliage.setColor(0.12, 0.35, 0.15, 1)
-            foliage.setTwoSided(True)
-            foliage.reparentTo(self.render)
-            self.env_props.append(foliage)
-        
-        print(f"Environment: Added {len(self.env_props)} props (rocks and trees)")
+        n_rocks = max(0, rocks_count)
+        angles = rng.uniform(0.0, 2.0 * math.pi, n_rocks)
+        radii = rng.uniform(rocks_min_r * scale, rocks_max_r * scale, n_rocks)
+        xs = np.cos(angles) * radii
+        ys = np.sin(angles) * radii
+        rscales = rng.uniform(rock_size_min, rock_size_max, n_rocks)
+        # Color rocks grey-brown
+        rock_colors = rng.uniform((0.55, 0.52, 0.48), (0.65, 0.60, 0.55), (n_rocks, 3))
+        keep = ~((np.abs(xs) < rocks_excl_w) & (np.abs(ys) < rocks_excl_l))
+
+        n_kept = int(np.count_nonzero(keep))
+        rock_origins = np.column_stack((xs[keep], ys[keep], np.full(n_kept, 0.5)))
+        rock_scales = rscales[keep, None] * (1.0, 1.0, 0.6)
+        rock_rgba = np.column_stack((rock_colors[keep], np.ones(n_kept)))
+
+        # Add random trees (simplified as cones): a trunk box and a foliage box
+        # (cone approximation) per tree.
+        n_trees = max(0, trees_count)
+        angles = rng.uniform(0.0, 2.0 * math.pi, n_trees)
+        radii = rng.uniform(trees_min_r * scale, trees_max_r * scale, n_trees)
+        xs = np.cos(angles) * radii
+        ys = np.sin(angles) * radii
+        keep = ~((np.abs(xs) < trees_excl_w) & (np.abs(ys) < trees_excl_l))
+
+        tree_xy = np.column_stack((xs[keep], ys[keep]))
+        n_kept = len(tree_xy)
+        trunk_origins = np.column_stack((tree_xy, np.full(n_kept, 1.5)))
+        foliage_origins = np.column_stack((tree_xy, np.full(n_kept, 5.0)))
+
+        origins = np.concatenate((rock_origins, trunk_origins, foliage_origins))
+        scales = np.concatenate((
+            rock_scales,
+            np.tile((0.8, 0.8, 3.0), (n_kept, 1)),
+            np.tile((3.5, 3.5, 4.0), (n_kept, 1)),
+        ))
+        colors = np.concatenate((
+            rock_rgba,
+            np.tile((0.35, 0.25, 0.15, 1.0), (n_kept, 1)),
+            np.tile((0.12, 0.35, 0.15, 1.0), (n_kept, 1)),
+        ))
+        prop_count = len(origins)
+
+        # The boxes are closed with outward (counter-clockwise) faces, so the
+        # default back-face culling applies.
+        if prop_count:
+            self.env_props_root.attachNewNode(self._build_box_batch("scenery", origins, scales, colors))
+
+        print(f"Environment: Added {prop_count} props (rocks and trees)")
+
+    def _build_box_batch(self, name: str, origins, scales, colors) -> GeomNode:
+        """Bake copies of the unit `box` into a single static Geom.
+
+        Box i is the template scaled by scales[i] and moved by origins[i] (the
+        box origin is its corner, as with copyTo + setScale/setPos), with a
+        per-vertex RGBA color, so all boxes render in one draw call.
+        """
+        template = self._box_template
+        n_boxes = len(origins)
+        n_corners = len(template)
+
+        vdata = GeomVertexData(name, GeomVertexFormat.getV3n3c4t2(), Geom.UHStatic)
+        vdata.setNumRows(n_boxes * n_corners)
+        verts = np.frombuffer(memoryview(vdata.modifyArray(0)), dtype=self._box_batch_vdtype)
+        verts = verts.reshape(n_boxes, n_corners)
+        verts["vertex"] = (
+            np.asarray(origins, dtype=np.float32)[:, None, :]
+            + np.asarray(scales, dtype=np.float32)[:, None, :] * template["vertex"]
+        )
+        verts["normal"] = template["normal"]
+        verts["texcoord"] = template["texcoord"]
+        # Truncate to 8 bits the way Panda3D packs float colors.
+        colors = np.clip(np.asarray(colors, dtype=np.float64), 0.0, 1.0)
+        verts["color"] = (colors * 255.0).astype(np.uint8)[:, None, :]
+
+        if n_boxes * n_corners < 0xFFFF:
+            index_type, index_dtype = Geom.NTUint16, np.uint16
+        else:
+            index_type, index_dtype = Geom.NTUint32, np.uint32
+        prim = GeomTriangles(Geom.UHStatic)
+        prim.setIndexType(index_type)
+        index_array = prim.modifyVertices()
+        index_array.setNumRows(n_boxes * len(self._box_template_tris))
+        indices = np.frombuffer(memoryview(index_array), dtype=index_dtype).reshape(n_boxes, -1)
+        indices[:] = self._box_template_tris + (np.arange(n_boxes) * n_corners)[:, None]
 
-    def _parse_resolution(self, text: str, *, default: tuple[int, int]) -> tuple[int, int]:
-        s = (text or "").strip().lower()
-        if "x" in s:
-            try:
-                w_s, h_s = s.split("x", 1)
-                w = int(w_s.strip())
-                h = int(h_s.strip())
-                if w > 0 and h > 0:
-                    return w, h
-            except Exception:
-                pass
-        return int(default[0]), int(default[1])
+        geom = Geom(vdata)
+        geom.addPrimitive(prim)
+        node = GeomNode(name)
+        node.addGeom(geom, self._box_state)
+        return node
 
     def _load_vehicle_config(self, vehicle_id: str) -> dict | None:
         vehicle_id = (vehicle_id or "").strip()
@@ -650,24 +814,38 @@ class RacingGame(ShowBase):
         terrain_output = str(terrain_data.get("output") or "race_base")
         terrain_generated_files = list(terrain_mod.generated_files or []) if terrain_mod else []
 
+        # One directory listing answers every res/terrain existence probe below;
+        # paths elsewhere still fall back to a stat.
+        terrain_dir = Path("res/terrain")
+        try:
+            with os.scandir(PROJECT_ROOT / terrain_dir) as it:
+                terrain_entries = {entry.name for entry in it}
+        except OSError:
+            terrain_entries = set()
+
+        def project_file_exists(rel) -> bool:
+            rel = Path(rel)
+            if rel.parent == terrain_dir:
+                return rel.name in terrain_entries
+            return (PROJECT_ROOT / rel).exists()
+
         heightmap_candidates = [
             Path("res/terrain") / f"{terrain_output}.npy",
             Path("res/terrain") / f"{terrain_output}.pgm",
         ]
         heightmap_path = None
         for cand in heightmap_candidates:
-            if (PROJECT_ROOT / cand).exists():
+            if project_file_exists(cand):
                 heightmap_path = str(cand)
                 break
         if heightmap_path is None:
             heightmap_path = "res/terrain/smoke_flat_hd_regen_cli.npy"
 
         colors = None
-        colors_path = PROJECT_ROOT / "res" / "terrain" / f"{terrain_output}_colors.json"
-        if colors_path.exists():
+        colors_rel = terrain_dir / f"{terrain_output}_colors.json"
+        if project_file_exists(colors_rel):
             try:
-                with open(colors_path, "r", encoding="utf-8") as f:
-                    colors = json.load(f)
+                colors = _read_json(PROJECT_ROOT / colors_rel)
             except Exception:
                 colors = None
 
@@ -690,18 +868,17 @@ class RacingGame(ShowBase):
 
         for runtime_candidate in terrain_runtime_candidates:
             runtime_abs = PROJECT_ROOT / runtime_candidate
-            if not runtime_abs.exists():
+            if not project_file_exists(runtime_candidate):
                 continue
             try:
-                with open(runtime_abs, "r", encoding="utf-8") as f:
-                    terrain_runtime = json.load(f)
+                terrain_runtime = _read_json(runtime_abs)
                 break
             except Exception:
                 terrain_runtime = None
 
         if terrain_runtime is None:
             baked_mesh = Path("res/terrain") / f"{terrain_output}_terrain_mesh.bam"
-            if (PROJECT_ROOT / baked_mesh).exists():
+            if project_file_exists(baked_mesh):
                 terrain_runtime = {
                     "version": "1.0",
                     "terrain_base": terrain_output,
@@ -713,10 +890,9 @@ class RacingGame(ShowBase):
         track_mod = cfg.modules.get("3_track")
         if track_mod and track_mod.generated_files:
             runtime_json = next((p for p in track_mod.generated_files if str(p).endswith("_runtime.json")), None)
-            if runtime_json and (PROJECT_ROOT / runtime_json).exists():
+            if runtime_json and project_file_exists(runtime_json):
                 try:
-                    with open(PROJECT_ROOT / runtime_json, "r", encoding="utf-8") as f:
-                        track = json.load(f)
+                    track = _read_json(PROJECT_ROOT / runtime_json)
                 except Exception:
                     track = None
         if track is None and track_mod:
@@ -726,10 +902,9 @@ class RacingGame(ShowBase):
         scenery_mod = cfg.modules.get("4_scenery")
         if scenery_mod and scenery_mod.generated_files:
             scen_json = next((p for p in scenery_mod.generated_files if str(p).endswith(".json")), None)
-            if scen_json and (PROJECT_ROOT / scen_json).exists():
+            if scen_json and project_file_exists(scen_json):
                 try:
-                    with open(PROJECT_ROOT / scen_json, "r", encoding="utf-8") as f:
-                        scenery = json.load(f)
+                    scenery = _read_json(PROJECT_ROOT / scen_json)
                 except Exception:
                     scenery = None
         if scenery is None and scenery_mod:
@@ -745,7 +920,9 @@ class RacingGame(ShowBase):
             "scenery": scenery,
         }
 
-    def _attach_centered_box(self, parent, name: str, size_xyz, pos_xyz, color_rgba, hpr_xyz=None):
+    def _attach_centered_box(
+        self, parent, name: str, size_xyz, pos_xyz, color_rgba, hpr_xyz=None, two_sided: bool = False
+    ):
         """Attach a unit box centered on the parent node.
 
         Panda3D's built-in `box` model spans [0..1] on each axis (origin is a corner).
@@ -759,6 +936,8 @@ class RacingGame(ShowBase):
             pos_xyz: (x, y, z) local position of the box center.
             color_rgba: (r, g, b, a).
             hpr_xyz: optional (h, p, r) in degrees.
+            two_sided: disable backface culling (the box is closed, so only
+                needed when it is viewed from inside or scaled negatively).
         """
         node = parent.attachNewNode(name)
         node.setPos(float(pos_xyz[0]), float(pos_xyz[1]), float(pos_xyz[2]))
@@ -766,11 +945,11 @@ class RacingGame(ShowBase):
             node.setHpr(float(hpr_xyz[0]), float(hpr_xyz[1]), float(hpr_xyz[2]))
         node.setScale(float(size_xyz[0]), float(size_xyz[1]), float(size_xyz[2]))
 
-        geom = self.loader.loadModel("box")
-        geom.reparentTo(node)
+        geom = self._box_proto.copyTo(node)
         geom.setPos(-0.5, -0.5, -0.5)
         geom.setColor(float(color_rgba[0]), float(color_rgba[1]), float(color_rgba[2]), float(color_rgba[3]))
-        geom.setTwoSided(True)
+        if two_sided:
+            geom.setTwoSided(True)
         return node
 
     def _attach_centered_cylinder(
@@ -784,6 +963,7 @@ class RacingGame(ShowBase):
         segments: int = 24,
         cap: bool = True,
         hpr_xyz=None,
+        two_sided: bool = False,
     ):
         """Attach a simple cylinder centered on the parent.
 
@@ -792,6 +972,9 @@ class RacingGame(ShowBase):
 
         The cylinder axis is the X axis. So it works well for wheels where rolling
         is a pitch rotation (P) around X.
+
+        Triangles wind counter-clockwise seen from outside, so backface culling
+        is left on unless `two_sided` is set (e.g. for an uncapped tube).
         """
 
         radius = float(radius)
@@ -805,86 +988,8 @@ class RacingGame(ShowBase):
         if hpr_xyz is not None:
             node.setHpr(float(hpr_xyz[0]), float(hpr_xyz[1]), float(hpr_xyz[2]))
 
-        fmt = GeomVertexFormat.getV3n3()
-        vdata = GeomVertexData(f"{name}_vdata", fmt, Geom.UHStatic)
-        vertex = GeomVertexWriter(vdata, "vertex")
-        normal = GeomVertexWriter(vdata, "normal")
-        prim = GeomTriangles(Geom.UHStatic)
-
-        idx = 0
-
-        def add_v(vx, vy, vz, nx, ny, nz):
-            nonlocal idx
-            vertex.addData3(float(vx), float(vy), float(vz))
-            normal.addData3(float(nx), float(ny), float(nz))
-            i = idx
-            idx += 1
-            return i
-
-        half = length * 0.5
-        two_pi = math.pi * 2.0
-
-        # Side surface
-        for i in range(segments):
-            a0 = two_pi * (i / segments)
-            a1 = two_pi * ((i + 1) / segments)
-
-            cos0, sin0 = math.cos(a0), math.sin(a0)
-            cos1, sin1 = math.cos(a1), math.sin(a1)
-
-            y0, z0 = cos0 * radius, sin0 * radius
-            y1, z1 = cos1 * radius, sin1 * radius
-
-            # Quad vertices
-            v0 = (-half, y0, z0)
-            v1 = (half, y0, z0)
-            v2 = (half, y1, z1)
-            v3 = (-half, y1, z1)
-
-            # Outward normals (no X component on the side).
-            n0 = (0.0, cos0, sin0)
-            n1 = (0.0, cos1, sin1)
-
-            # Two triangles: (v0, v2, v1) and (v0, v3, v2)
-            i0 = add_v(*v0, *n0)
-            i1 = add_v(*v2, *n1)
-            i2 = add_v(*v1, *n0)
-            prim.addVertices(i0, i1, i2)
-
-            i3 = add_v(*v0, *n0)
-            i4 = add_v(*v3, *n1)
-            i5 = add_v(*v2, *n1)
-            prim.addVertices(i3, i4, i5)
-
-        # Caps
-        if cap:
-            for i in range(segments):
-                a0 = two_pi * (i / segments)
-                a1 = two_pi * ((i + 1) / segments)
-                cos0, sin0 = math.cos(a0), math.sin(a0)
-                cos1, sin1 = math.cos(a1), math.sin(a1)
-
-                y0, z0 = cos0 * radius, sin0 * radius
-                y1, z1 = cos1 * radius, sin1 * radius
-
-                # Left cap faces -X: (center, rim1, rim0)
-                c0 = add_v(-half, 0.0, 0.0, -1.0, 0.0, 0.0)
-                r1 = add_v(-half, y1, z1, -1.0, 0.0, 0.0)
-                r0 = add_v(-half, y0, z0, -1.0, 0.0, 0.0)
-                prim.addVertices(c0, r1, r0)
-
-                # Right cap faces +X: (center, rim0, rim1)
-                c1 = add_v(half, 0.0, 0.0, 1.0, 0.0, 0.0)
-                r0b = add_v(half, y0, z0, 1.0, 0.0, 0.0)
-                r1b = add_v(half, y1, z1, 1.0, 0.0, 0.0)
-                prim.addVertices(c1, r0b, r1b)
-
-        prim.closePrimitive()
-
-        geom = Geom(vdata)
-        geom.addPrimitive(prim)
         geom_node = GeomNode(f"{name}_geom")
-        geom_node.addGeom(geom)
+        geom_node.addGeom(self._get_cylinder_geom(radius, length, segments, cap))
 
         geom_np = node.attachNewNode(geom_node)
         geom_np.setColor(
@@ -893,11 +998,118 @@ class RacingGame(ShowBase):
             float(color_rgba[2]),
             float(color_rgba[3]),
         )
-        geom_np.setTwoSided(True)
+        if two_sided:
+            geom_np.setTwoSided(True)
         # Guard against any parent non-uniform scaling.
         geom_np.setAttrib(RescaleNormalAttrib.make(RescaleNormalAttrib.MNormalize))
         return node
    
+    def _get_cylinder_geom(self, radius: float, length: float, segments: int, cap: bool):
+        """Return the (shared) cylinder Geom for the given shape.
+
+        Identical wheels reuse one vertex buffer; each caller wraps it in its own
+        GeomNode so per-instance color/attribs stay independent.
+        """
+        key = (radius, length, segments, bool(cap))
+        cached = self._cylinder_geoms.get(key)
+        if cached is not None:
+            return cached
+
+        half = length * 0.5
+
+        # One ring of `segments` vertices per end; segment i spans ring[i]..ring[j]
+        # with j = (i + 1) % segments, so the seam vertex is shared too.
+        angles = np.linspace(0.0, 2.0 * math.pi, segments, endpoint=False)
+        ring_cos = np.cos(angles)
+        ring_sin = np.sin(angles)
+        i0 = np.arange(segments)
+        i1 = (i0 + 1) % segments
+
+        # Vertex layout:
+        #   [0, seg)            left side ring  (radial normals)
+        #   [seg, 2*seg)        right side ring (radial normals)
+        #   cap only:
+        #   2*seg               left cap center, then seg left cap ring  (-X)
+        #   3*seg + 1           right cap center, then seg right cap ring (+X)
+        # Caps need their own ring vertices because their normals are axial.
+        n_verts = segments * (4 if cap else 2) + (2 if cap else 0)
+        n_tris = segments * (4 if cap else 2)
+
+        # Fill the vertex and index arrays in place through their buffers
+        # (setNumRows zero-fills, which also clears the normal padding byte).
+        vdata = GeomVertexData("cylinder_vdata", self._cylinder_vformat, Geom.UHStatic)
+        vdata.setNumRows(n_verts)
+        verts = np.frombuffer(memoryview(vdata.modifyArray(0)), dtype=self._cylinder_vdtype)
+        pos = verts["vertex"]
+        nrm = verts["normal"]
+
+        # 16-bit indices unless the ring is fine enough to overflow them.
+        if n_verts < 0xFFFF:
+            index_type, index_dtype = Geom.NTUint16, np.uint16
+        else:
+            index_type, index_dtype = Geom.NTUint32, np.uint32
+        prim = GeomTriangles(Geom.UHStatic)
+        prim.setIndexType(index_type)
+        index_array = prim.modifyVertices()
+        index_array.setNumRows(n_tris * 3)
+        tris = np.frombuffer(memoryview(index_array), dtype=index_dtype).reshape(n_tris, 3)
+
+        ring_y = ring_cos * radius
+        ring_z = ring_sin * radius
+        ring_ny = np.rint(ring_cos * 127.0)
+        ring_nz = np.rint(ring_sin * 127.0)
+
+        left = slice(0, segments)
+        right = slice(segments, segments * 2)
+        pos[left, 0] = -half
+        pos[right, 0] = half
+        for ring in (left, right):
+            pos[ring, 1] = ring_y
+            pos[ring, 2] = ring_z
+            # Outward normals (no X component on the side).
+            nrm[ring, 1] = ring_ny
+            nrm[ring, 2] = ring_nz
+
+        # Side surface: per segment (L0, R1, R0) and (L0, L1, R1), emitted as
+        # adjacent pairs walking around the ring so consecutive triangles
+        # reuse the vertices just transformed (post-transform cache friendly;
+        # the cap fans below already walk their rims in order).
+        r0 = i0 + segments
+        r1 = i1 + segments
+        tris[0 : segments * 2 : 2, 0] = i0
+        tris[0 : segments * 2 : 2, 1] = r1
+        tris[0 : segments * 2 : 2, 2] = r0
+        tris[1 : segments * 2 : 2, 0] = i0
+        tris[1 : segments * 2 : 2, 1] = i1
+        tris[1 : segments * 2 : 2, 2] = r1
+
+        if cap:
+            # Fans around one shared center per cap.
+            # Left cap faces -X: (center, rim1, rim0).
+            # Right cap faces +X: (center, rim0, rim1).
+            lc = segments * 2
+            rc = lc + segments + 1
+            for center, x, n_x, tri0, rim_a, rim_b in (
+                (lc, -half, -127, segments * 2, i1, i0),
+                (rc, half, 127, segments * 3, i0, i1),
+            ):
+                fan = slice(center, center + segments + 1)
+                rim = slice(center + 1, center + segments + 1)
+                pos[fan, 0] = x
+                nrm[fan, 0] = n_x
+                pos[rim, 1] = ring_y
+                pos[rim, 2] = ring_z
+
+                fan_tris = tris[tri0 : tri0 + segments]
+                fan_tris[:, 0] = center
+                fan_tris[:, 1] = center + 1 + rim_a
+                fan_tris[:, 2] = center + 1 + rim_b
+
+        geom = Geom(vdata)
+        geom.addPrimitive(prim)
+        self._cylinder_geoms[key] = geom
+        return geom
+
     def create_vehicle_visuals(self):
         """(Re)build the vehicle visual hierarchy.
 
@@ -916,6 +1128,7 @@ class RacingGame(ShowBase):
                 pass
 
         self.vehicle_node = self.render.attachNewNode("vehicle")
+        self.vehicle_node.setAntialias(AntialiasAttrib.MAuto)
         self._vehicle_visual_ready = False
         # A separate node lets us change pose without touching world-space placement.
         self.chassis_node = self.vehicle_node.attachNewNode("chassis")
@@ -936,27 +1149,27 @@ class RacingGame(ShowBase):
         track_width = float(pose_cfg.get("track_width", 1.8))
         wheelbase = float(pose_cfg.get("wheelbase", 2.6))
 
+        # Parse wheel configs once into rows of (x, y, z, radius); a missing or
+        # malformed position is NaN so it can be excluded from the ground offset.
+        wheel_arr = np.full((len(wheel_cfgs), 4), np.nan)
+        for i, w in enumerate(wheel_cfgs):
+            pos = w.get("position", [0.0, 0.0, 0.0])
+            if isinstance(pos, (list, tuple)) and len(pos) >= 3:
+                wheel_arr[i, :3] = [float(pos[0]), float(pos[1]), float(pos[2])]
+            wheel_arr[i, 3] = float(w.get("radius", 0.35))
+
         avg_radius = 0.35
         if wheel_cfgs:
-            radii = [float(w.get("radius", 0.35)) for w in wheel_cfgs]
-            avg_radius = sum(radii) / float(len(radii))
-            avg_radius = max(0.1, min(1.0, avg_radius))
+            avg_radius = float(np.clip(wheel_arr[:, 3].mean(), 0.1, 1.0))
 
         body_width = track_width * 0.9
         body_length = wheelbase * 1.35
         body_height = max(0.35, avg_radius * 1.2)
 
         # Ground offset: align the lowest wheel bottom to z=0 in vehicle-local space.
-        min_bottom = None
-        for w in wheel_cfgs:
-            pos = w.get("position", [0.0, 0.0, 0.0])
-            if not isinstance(pos, (list, tuple)) or len(pos) < 3:
-                continue
-            r = float(w.get("radius", 0.35))
-            bottom = float(pos[2]) - r
-            if min_bottom is None or bottom < min_bottom:
-                min_bottom = bottom
-        self.vehicle_ground_offset = -float(min_bottom) if min_bottom is not None else 0.55
+        bottoms = wheel_arr[:, 2] - wheel_arr[:, 3]
+        bottoms = bottoms[~np.isnan(bottoms)]
+        self.vehicle_ground_offset = -float(bottoms.min()) if bottoms.size else 0.55
 
         # Body parts (all centered boxes).
         self._attach_centered_box(
@@ -1000,25 +1213,30 @@ class RacingGame(ShowBase):
             (0.1, 0.1, 0.12, 1.0),
         )
 
-        # Wheels (centered boxes under a steering + spin rig).
-        self.wheel_visuals = []
-        for i, w in enumerate(wheel_cfgs):
-            pos = w.get("position", [0.0, 0.0, 0.0])
-            if not isinstance(pos, (list, tuple)) or len(pos) < 3:
-                pos = [0.0, 0.0, 0.0]
-
-            radius = float(w.get("radius", 0.35))
-            radius = max(0.1, min(1.0, radius))
+        # The body is rigid: collapse its box nodes into one GeomNode. Wheels are
+        # built afterwards under chassis_node so their rigs stay animatable.
+        self.body_node.flattenStrong()
+
+        # Wheels: one rig node per wheel carries steering (H), rolling (P) and
+        # suspension travel (Z); _update_visuals sets all three in one call.
+        # Per-wheel rest data is kept as parallel lists (one per field) so the
+        # per-frame loop zips plain floats instead of reading dicts.
+        wheel_pos = np.nan_to_num(wheel_arr[:, :3])
+        self.wheel_rigs = []
+        self.wheel_x = wheel_pos[:, 0].tolist()
+        self.wheel_y = wheel_pos[:, 1].tolist()
+        self.wheel_base_z = wheel_pos[:, 2].tolist()
+        self.wheel_radius = np.clip(wheel_arr[:, 3], 0.1, 1.0).tolist()
+        for i, (x, y, radius) in enumerate(zip(self.wheel_x, self.wheel_y, self.wheel_radius)):
             wheel_width = max(0.18, radius * 0.55)
             diameter = radius * 2.0
 
-            pivot = self.chassis_node.attachNewNode(f"wheel_pivot_{i}")
-            pivot.setPos(float(pos[0]), float(pos[1]), 0.0)
-            spin = pivot.attachNewNode(f"wheel_spin_{i}")
+            rig = self.chassis_node.attachNewNode(f"wheel_rig_{i}")
+            rig.setPos(x, y, 0.0)
 
             # Tire (cylinder)
             self._attach_centered_cylinder(
-                spin,
+                rig,
                 f"wheel_tire_{i}",
                 radius=radius,
                 length=wheel_width,
@@ -1030,24 +1248,14 @@ class RacingGame(ShowBase):
 
             # Hub (keep as a box so rotation is visible)
             self._attach_centered_box(
-                spin,
+                rig,
                 f"wheel_hub_{i}",
                 (wheel_width * 0.6, diameter * 0.55, diameter * 0.55),
                 (0.0, 0.0, 0.0),
                 (0.75, 0.75, 0.78, 1.0),
             )
 
-            self.wheel_visuals.append(
-                {
-                    "pivot": pivot,
-                    "spin": spin,
-                    "radius": radius,
-                    "base_z": float(pos[2]),
-                }
-            )
-
-        # Shading + lighting.
-        self.vehicle_node.setShaderAuto()
+            self.wheel_rigs.append(rig)
 
     def setup_camera(self):
         """Setup camera"""
@@ -1057,6 +1265,12 @@ class RacingGame(ShowBase):
         self.camera_smooth = 0.06
         self.camera_smooth_catchup = 0.22
         self._camera_catchup_frames = 0
+        # Last (position, target) the follow camera was aimed with; lookAt is
+        # skipped while both stay put (e.g. the vehicle is parked).
+        self._camera_last_look = None
+        # (anchor, forward) the follow camera has fully converged on; while the
+        # vehicle holds that pose the whole follow update is skipped.
+        self._camera_settled_follow = None
 
         # Camera control mode: True = manual debug camera, False = auto-follow
         self.camera_manual = False
@@ -1073,10 +1287,17 @@ class RacingGame(ShowBase):
         self._debug_cam_orbiting = False
         self._debug_cam_panning = False
         self._debug_cam_last_mouse = None
+        self._mouse_watcher = self.mouseWatcherNode
+        self._mouse_xy = None
         # Mouse coordinates are in [-1..1]. These are tuned for trackpad use.
         self._debug_cam_rotate_speed = 1.6  # radians per normalized unit
         self._debug_cam_pan_speed = 0.75    # scaled by distance
         self._debug_cam_zoom_factor = 0.9
+        # Cached (sin_yaw, cos_yaw, sin_pitch, cos_pitch) for the last applied
+        # (yaw, pitch), plus a reusable offset vector.
+        self._debug_cam_trig_angles = None
+        self._debug_cam_trig = (0.0, 1.0, 0.0, 1.0)
+        self._debug_cam_offset = Vec3(0.0, 0.0, 0.0)
 
     def _get_camera_follow_anchor(self, state):
         """Return follow anchor position + forward direction in world space.
@@ -1084,9 +1305,8 @@ class RacingGame(ShowBase):
         Use visual transform once available so camera stays locked to what the
         player actually sees, not a potentially different simulation Z.
         """
-        visual_ready = bool(getattr(self, "_vehicle_visual_ready", False))
-        vehicle_node = getattr(self, "vehicle_node", None)
-        if visual_ready and vehicle_node is not None:
+        vehicle_node = self.vehicle_node
+        if self._vehicle_visual_ready:
             anchor = vehicle_node.getPos(self.render)
             quat = vehicle_node.getQuat(self.render)
             forward = quat.getForward()
@@ -1096,18 +1316,24 @@ class RacingGame(ShowBase):
                 forward = Vec3(0.0, 1.0, 0.0)
             return anchor, forward
 
-        heading_rad = math.radians(state.heading)
+        heading_rad = _radians(state.heading)
         anchor = Vec3(float(state.position.x), float(state.position.y), float(state.position.z))
-        forward = Vec3(math.sin(heading_rad), math.cos(heading_rad), 0.0)
+        forward = Vec3(_sin(heading_rad), _cos(heading_rad), 0.0)
         if forward.length_squared() > 1e-8:
             forward.normalize()
         return anchor, forward
 
+    def _refresh_mouse_xy(self):
+        """Sample the mouse once per frame; camera helpers read the cached value."""
+        watcher = self._mouse_watcher
+        if watcher is not None and watcher.hasMouse():
+            m = watcher.getMouse()
+            self._mouse_xy = (m.getX(), m.getY())
+        else:
+            self._mouse_xy = None
+
     def _get_mouse_xy(self):
-        if self.mouseWatcherNode and self.mouseWatcherNode.hasMouse():
-            m = self.mouseWatcherNode.getMouse()
-            return (float(m.getX()), float(m.getY()))
-        return None
+        return self._mouse_xy
 
     def _sync_debug_camera_from_view(self):
         """Derive orbit camera params from the current follow camera view.
@@ -1120,20 +1346,30 @@ class RacingGame(ShowBase):
         target = Vec3(anchor.x, anchor.y, anchor.z + float(self.camera_target_height))
 
         cam_pos = self.camera.getPos(self.render)
-        offset = cam_pos - target
-        dist = offset.length()
+        dist, yaw, pitch = _derive_orbit(
+            float(cam_pos.x - target.x),
+            float(cam_pos.y - target.y),
+            float(cam_pos.z - target.z),
+        )
         if dist < 1e-3:
-            dist = float(self.camera_distance)
-            offset = Vec3(0.0, -dist, 0.0)
-
-        horiz = math.sqrt(float(offset.x * offset.x + offset.y * offset.y))
-        yaw = math.atan2(float(-offset.x), float(-offset.y))
-        pitch = math.atan2(float(offset.z), float(horiz))
+            dist, yaw, pitch = _derive_orbit(0.0, -float(self.camera_distance), 0.0)
 
         self._debug_cam_target = target
-        self._debug_cam_distance = float(dist)
-        self._debug_cam_yaw = float(yaw)
-        self._debug_cam_pitch = float(pitch)
+        self._debug_cam_distance = dist
+        self._debug_cam_yaw = yaw
+        self._debug_cam_pitch = pitch
+
+    def _get_debug_cam_trig(self, pitch: float):
+        """Return (sin_yaw, cos_yaw, sin_pitch, cos_pitch) for the current yaw.
+
+        Zoom and pan keep the angles, so only orbiting pays for the trig.
+        """
+        angles = (self._debug_cam_yaw, pitch)
+        if angles != self._debug_cam_trig_angles:
+            yaw = self._debug_cam_yaw
+            self._debug_cam_trig = (_sin(yaw), _cos(yaw), _sin(pitch), _cos(pitch))
+            self._debug_cam_trig_angles = angles
+        return self._debug_cam_trig
 
     def _apply_debug_camera(self):
         dist = max(2.0, float(self._debug_cam_distance))
@@ -1141,18 +1377,15 @@ class RacingGame(ShowBase):
         self._debug_cam_distance = dist
         self._debug_cam_pitch = pitch
 
-        cos_pitch = math.cos(pitch)
-        sin_pitch = math.sin(pitch)
-        sin_yaw = math.sin(self._debug_cam_yaw)
-        cos_yaw = math.cos(self._debug_cam_yaw)
+        sin_yaw, cos_yaw, sin_pitch, cos_pitch = self._get_debug_cam_trig(pitch)
 
-        offset = Vec3(
+        offset = self._debug_cam_offset
+        offset.set(
             -sin_yaw * cos_pitch * dist,
             -cos_yaw * cos_pitch * dist,
             sin_pitch * dist,
         )
-        cam_pos = self._debug_cam_target + offset
-        self.camera.setPos(cam_pos)
+        self.camera.setPos(self._debug_cam_target + offset)
         self.camera.lookAt(self._debug_cam_target)
 
     def _debug_cam_begin_orbit(self):
@@ -1160,6 +1393,9 @@ class RacingGame(ShowBase):
             return
         self._debug_cam_orbiting = True
         self._debug_cam_panning = False
+        # Event handlers run outside the update task; refresh so the drag
+        # starts from the real cursor position, not last frame's sample.
+        self._refresh_mouse_xy()
         self._debug_cam_last_mouse = self._get_mouse_xy()
 
     def _debug_cam_end_orbit(self):
@@ -1171,6 +1407,9 @@ class RacingGame(ShowBase):
             return
         self._debug_cam_panning = True
         self._debug_cam_orbiting = False
+        # Event handlers run outside the update task; refresh so the drag
+        # starts from the real cursor position, not last frame's sample.
+        self._refresh_mouse_xy()
         self._debug_cam_last_mouse = self._get_mouse_xy()
 
     def _debug_cam_end_pan(self):
@@ -1181,9 +1420,9 @@ class RacingGame(ShowBase):
         if not self.camera_manual:
             return
         if direction > 0:
-            self._debug_cam_distance *= float(self._debug_cam_zoom_factor)
+            self._debug_cam_distance *= self._debug_cam_zoom_factor
         else:
-            self._debug_cam_distance /= float(self._debug_cam_zoom_factor)
+            self._debug_cam_distance /= self._debug_cam_zoom_factor
         self._apply_debug_camera()
 
     def _update_debug_camera(self):
@@ -1204,20 +1443,30 @@ class RacingGame(ShowBase):
         dx = mx - last_x
         dy = my - last_y
         self._debug_cam_last_mouse = xy
+        # The drag is applied once per frame from the per-frame mouse sample, so
+        # motion events are already coalesced; a held-still drag costs nothing.
+        if dx == 0.0 and dy == 0.0:
+            return
 
         if self._debug_cam_orbiting:
-            self._debug_cam_yaw -= dx * float(self._debug_cam_rotate_speed)
-            self._debug_cam_pitch += dy * float(self._debug_cam_rotate_speed)
+            self._debug_cam_yaw -= dx * self._debug_cam_rotate_speed
+            self._debug_cam_pitch += dy * self._debug_cam_rotate_speed
             self._apply_debug_camera()
             return
 
-        # Pan target in the camera view plane.
-        quat = self.camera.getQuat(self.render)
-        right = quat.getRight()
-        up = quat.getUp()
-        scale = float(self._debug_cam_distance) * float(self._debug_cam_pan_speed)
-        self._debug_cam_target -= right * (dx * scale)
-        self._debug_cam_target += up * (dy * scale)
+        # Pan target in the camera view plane. The orbit camera looks along
+        # (sy*cp, cy*cp, -sp), so its right/up axes follow from yaw/pitch alone.
+        # Applied to the target in place: target - right * dx' + up * dy'.
+        sin_yaw, cos_yaw, sin_pitch, cos_pitch = self._get_debug_cam_trig(self._debug_cam_pitch)
+        scale = self._debug_cam_distance * self._debug_cam_pan_speed
+        right_step = dx * scale
+        up_step = dy * scale
+        target = self._debug_cam_target
+        target.set(
+            target.x - cos_yaw * right_step + sin_yaw * sin_pitch * up_step,
+            target.y + sin_yaw * right_step + cos_yaw * sin_pitch * up_step,
+            target.z + cos_pitch * up_step,
+        )
         self._apply_debug_camera()
     
     def _init_camera_position(self):
@@ -1227,7 +1476,9 @@ class RacingGame(ShowBase):
         cam_pos = anchor - forward * float(self.camera_distance) + Vec3(0.0, 0.0, float(self.camera_height))
         self.camera.setPos(cam_pos)
         target = Vec3(anchor.x, anchor.y, anchor.z + float(self.camera_target_height))
-        self.camera.lookAt(target)
+        self._camera_last_look = None
+        self._camera_settled_follow = None
+        self._camera_look_at(target)
     
     def setup_inputs(self):
         """Setup keyboard inputs"""
@@ -1237,33 +1488,16 @@ class RacingGame(ShowBase):
             "steering": 0.0,
             "handbrake": False
         }
+        # Last inputs forwarded to the vehicle; `update` only calls the setters
+        # whose key changed (None forces every setter on the first frame).
+        self._last_keys = dict.fromkeys(self.keys)
         
-        # Throttle
-        self.accept("w", self.set_key, ["throttle", 1.0])
-        self.accept("w-up", self.set_key, ["throttle", 0.0])
-        self.accept("arrow_up", self.set_key, ["throttle", 1.0])
-        self.accept("arrow_up-up", self.set_key, ["throttle", 0.0])
-        
-        # Brake
-        self.accept("s", self.set_key, ["brake", 1.0])
-        self.accept("s-up", self.set_key, ["brake", 0.0])
-        self.accept("arrow_down", self.set_key, ["brake", 1.0])
-        self.accept("arrow_down-up", self.set_key, ["brake", 0.0])
-        
-        # Steering
-        self.accept("a", self.set_key, ["steering", -1.0])
-        self.accept("a-up", self.set_key, ["steering", 0.0])
-        self.accept("arrow_left", self.set_key, ["steering", -1.0])
-        self.accept("arrow_left-up", self.set_key, ["steering", 0.0])
-        
-        self.accept("d", self.set_key, ["steering", 1.0])
-        self.accept("d-up", self.set_key, ["steering", 0.0])
-        self.accept("arrow_right", self.set_key, ["steering", 1.0])
-        self.accept("arrow_right-up", self.set_key, ["steering", 0.0])
-        
-        # Handbrake
-        self.accept("space", self.set_key, ["handbrake", True])
-        self.accept("space-up", self.set_key, ["handbrake", False])
+        # Driving controls
+        set_key = self.set_key
+        for control, keys, pressed, released in self._KEY_BINDINGS:
+            for key in keys:
+                self.accept(key, set_key, [control, pressed])
+                self.accept(f"{key}-up", set_key, [control, released])
         
         # Exit
         self.accept("escape", self.exit_game)
@@ -1304,6 +1538,9 @@ class RacingGame(ShowBase):
             self._debug_cam_panning = False
             self._debug_cam_last_mouse = None
             self._camera_catchup_frames = 30
+            # The debug camera re-aimed the view; force the next lookAt.
+            self._camera_last_look = None
+            self._camera_settled_follow = None
             print("Camera: AUTO-FOLLOW mode")
     
     def setup_ui(self):
@@ -1338,6 +1575,10 @@ class RacingGame(ShowBase):
             shadow=(0, 0, 0, 0.8)
         )
         
+        # Last (speed_kmh, rpm, gear) shown; setText rebuilds the text geometry,
+        # so _update_ui only calls it when a displayed integer changes.
+        self._ui_last = [None, None, None]
+
         # Terrain info
         self.terrain_text = OnscreenText(
             text="Terrain: Enhanced Procedural",
@@ -1361,35 +1602,54 @@ class RacingGame(ShowBase):
     def update(self, task):
         """Main update loop"""
         dt = globalClock.getDt()
+
+        # Only the manual debug camera consumes mouse input.
+        if self.camera_manual:
+            self._refresh_mouse_xy()
         
-        # Update vehicle controls
-        self.player_vehicle.set_throttle(self.keys["throttle"])
-        self.player_vehicle.set_brake(self.keys["brake"])
-        self.player_vehicle.set_steering(self.keys["steering"])
-        self.player_vehicle.set_handbrake(self.keys["handbrake"])
+        vehicle = self.player_vehicle
+        keys = self.keys
+
+        # Update vehicle controls (only the inputs that actually changed)
+        last_keys = self._last_keys
+        if keys != last_keys:
+            if keys["throttle"] != last_keys["throttle"]:
+                vehicle.set_throttle(keys["throttle"])
+            if keys["brake"] != last_keys["brake"]:
+                vehicle.set_brake(keys["brake"])
+            if keys["steering"] != last_keys["steering"]:
+                vehicle.set_steering(keys["steering"])
+            if keys["handbrake"] != last_keys["handbrake"]:
+                vehicle.set_handbrake(keys["handbrake"])
+            last_keys.update(keys)
         
         # Update vehicle physics
-        self.player_vehicle.update(dt)
+        vehicle.update(dt)
         self.world.update(dt)
         
         # Get vehicle state
-        state = self.player_vehicle.get_state()
-        pose = self.player_vehicle.get_pose_state()
-        trans = self.player_vehicle.get_transmission_state()
-        wheels = self.player_vehicle.get_wheels_state()
+        state = vehicle.get_state()
+        pose = vehicle.get_pose_state()
+        trans = vehicle.get_transmission_state()
+        wheels = vehicle.get_wheels_state()
         
         # Sample terrain height at vehicle position
-        terrain_height = self.terrain.sample_height(state.position.x, state.position.y)
-        terrain_normal = self.terrain.sample_normal(state.position.x, state.position.y)
+        terrain = self.terrain
+        px = state.position.x
+        py = state.position.y
+        terrain_height, terrain_normal = terrain.sample_height_and_normal(px, py)
         
         # Update visual position
         self._update_visuals(state, pose, wheels, terrain_height, terrain_normal)
 
+        # Follow anchor/heading shared by the shadow focus and the camera.
+        follow = self._get_camera_follow_anchor(state)
+
         # Keep the directional-light shadow camera centered around the vehicle.
-        self._update_shadow_focus(state)
+        self._update_shadow_focus(state, follow)
         
         # Update camera
-        self._update_camera(state, terrain_height)
+        self._update_camera(state, terrain_height, follow)
 
         # Manual debug camera updates (orbit/pan while dragging).
         if self.camera_manual:
@@ -1405,8 +1665,8 @@ class RacingGame(ShowBase):
         
         坐标系统：
         - vehicle_node 的位置 = 车辆质心在地形上的位置
-        - wheel_pivot 的位置 = 轮子相对车身的局部坐标（X: 左右, Y: 前后）
-        - wheel_spin 的 Z = 悬挂压缩偏移
+        - wheel_rig 的 XY = 轮子相对车身的局部坐标（X: 左右, Y: 前后）
+        - wheel_rig 的 Z = 悬挂压缩偏移
         """
         pos = state.position
         # Place the vehicle so wheel bottoms do not penetrate the terrain.
@@ -1415,41 +1675,48 @@ class RacingGame(ShowBase):
         # an additional required lift from per-wheel terrain samples + suspension
         # offsets. This keeps the visuals from clipping into the ground even though
         # the simulation currently does not solve vertical contact.
-        ground_offset = float(getattr(self, "vehicle_ground_offset", 0.55))
-        z_base = float(terrain_height) + ground_offset
+        z_base = terrain_height + self.vehicle_ground_offset
+
+        get_suspension = self.player_vehicle.get_wheel_suspension_state
+        sample_height = self.terrain.sample_height
 
+        # One pass per wheel: pose the wheel rig (chassis-local, so independent of
+        # the body height solved here) and accumulate the lift it requires.
         z_required = z_base
-        try:
-            req = None
-            for i, vis in enumerate(getattr(self, "wheel_visuals", [])):
-                if i >= len(wheels.wheels):
-                    continue
-                wheel_state = wheels.wheels[i]
-
-                base_z = float(vis.get("base_z", 0.0))
-                radius = float(vis.get("radius", 0.35))
-
-                suspension = self.player_vehicle.get_wheel_suspension_state(i)
-                z_offset = float(suspension.wheel_offset.z) if suspension else 0.0
-
-                # Sample terrain height under each wheel (XY only).
-                wx = float(wheel_state.position.x)
-                wy = float(wheel_state.position.y)
-                th = float(terrain_height)
-                if hasattr(self, "terrain") and self.terrain is not None:
-                    try:
-                        th = float(self.terrain.sample_height(wx, wy))
-                    except Exception:
-                        th = float(terrain_height)
-
-                bottom_local = base_z + z_offset - radius
-                required_i = th - bottom_local
-                req = required_i if req is None else max(req, required_i)
-
-            if req is not None:
-                z_required = max(z_required, float(req))
-        except Exception:
-            z_required = z_base
+        for i, (rig, x, y, base_z, radius, wheel_state) in enumerate(
+            zip(
+                self.wheel_rigs,
+                self.wheel_x,
+                self.wheel_y,
+                self.wheel_base_z,
+                self.wheel_radius,
+                wheels.wheels,
+            )
+        ):
+            # 悬挂压缩（轮子相对车身的上下移动）
+            suspension = get_suspension(i)
+            z_offset = float(suspension.wheel_offset.z) if suspension else 0.0
+
+            # Steering (H around Z) and rolling (P around the steered X axis).
+            # Heading about Z leaves the suspension Z offset unchanged, so one
+            # transform covers all three.
+            rig.setPosHpr(
+                x,
+                y,
+                base_z + z_offset,
+                -wheel_state.steering_angle,
+                wheel_state.rotation_angle,
+                0.0,
+            )
+
+            # Sample terrain height under each wheel (XY only).
+            wheel_pos = wheel_state.position
+            th = sample_height(wheel_pos.x, wheel_pos.y)
+
+            bottom_local = base_z + z_offset - radius
+            required_i = th - bottom_local
+            if required_i > z_required:
+                z_required = required_i
 
         # Small clearance avoids visible z-fighting/near-zero penetration.
         z_required += 0.02
@@ -1468,32 +1735,8 @@ class RacingGame(ShowBase):
         # Pitch/roll on the chassis node so wheel local coordinates remain stable.
         if hasattr(self, "chassis_node") and self.chassis_node is not None:
             self.chassis_node.setHpr(0.0, pose.pitch * 0.5, pose.roll * 0.5)
-        
-        # 更新车轮
-        for i, vis in enumerate(getattr(self, "wheel_visuals", [])):
-            if i >= len(wheels.wheels):
-                continue
-            
-            wheel_state = wheels.wheels[i]
-            pivot = vis.get("pivot")
-            spin = vis.get("spin")
-            base_z = vis.get("base_z", -0.35)
-            
-            if pivot is None or spin is None:
-                continue
-            
-            # Steering angle (yaw around Z) on the pivot.
-            pivot.setH(-wheel_state.steering_angle)
-            
-            # 悬挂压缩（轮子相对车身的上下移动）
-            suspension = self.player_vehicle.get_wheel_suspension_state(i)
-            z_offset = suspension.wheel_offset.z if suspension else 0.0
-            spin.setZ(base_z + z_offset)
-            
-            # 轮子滚动（绕X轴的pitch旋转）
-            spin.setP(wheel_state.rotation_angle)
 
-    def _update_camera(self, state, terrain_height):
+    def _update_camera(self, state, terrain_height, follow=None):
         """Update camera"""
         # Only update camera in auto-follow mode
         if self.camera_manual:
@@ -1506,27 +1749,71 @@ class RacingGame(ShowBase):
             smooth = self.camera_smooth_catchup
             self._camera_catchup_frames -= 1
             
-        anchor, forward = self._get_camera_follow_anchor(state)
-        desired_pos = anchor - forward * float(self.camera_distance) + Vec3(0.0, 0.0, float(self.camera_height))
-        
-        current_pos = self.camera.getPos()
-        new_x = current_pos[0] + (desired_pos[0] - current_pos[0]) * smooth
-        new_y = current_pos[1] + (desired_pos[1] - current_pos[1]) * smooth
-        new_z = current_pos[2] + (desired_pos[2] - current_pos[2]) * smooth
+        anchor, forward = follow if follow is not None else self._get_camera_follow_anchor(state)
+        settled = self._camera_settled_follow
+        if (
+            settled is not None
+            and (anchor - settled[0]).lengthSquared() < 1e-8
+            and (forward - settled[1]).lengthSquared() < 1e-8
+        ):
+            return
+
+        # Camera settings are plain floats (see setup_camera).
+        desired_pos = anchor - forward * self.camera_distance
+        desired_pos.z += self.camera_height
         
-        self.camera.setPos(new_x, new_y, new_z)
-        target = Vec3(anchor.x, anchor.y, anchor.z + float(self.camera_target_height))
+        camera = self.camera
+        current_pos = camera.getPos()
+        # Lerp in place on the fresh `desired_pos` temporary.
+        desired_pos -= current_pos
+        if self._camera_catchup_frames == 0 and desired_pos.lengthSquared() < 1e-6:
+            self._camera_settled_follow = (anchor, forward)
+        else:
+            self._camera_settled_follow = None
+        desired_pos *= smooth
+        desired_pos += current_pos
+        camera.setPos(desired_pos)
+        self._camera_look_at(Vec3(anchor.x, anchor.y, anchor.z + self.camera_target_height), desired_pos)
+
+    def _camera_look_at(self, target: Vec3, cam_pos=None) -> None:
+        """Aim the follow camera at `target` unless neither it nor the camera moved.
+
+        Both `target` and `cam_pos` (the camera position just set, if known) are
+        kept for the next comparison, so callers must pass fresh vectors.
+        """
+        if cam_pos is None:
+            cam_pos = self.camera.getPos()
+        last = self._camera_last_look
+        if (
+            last is not None
+            and (cam_pos - last[0]).lengthSquared() < 1e-6
+            and (target - last[1]).lengthSquared() < 1e-6
+        ):
+            return
         self.camera.lookAt(target)
+        self._camera_last_look = (cam_pos, target)
     
     def _update_ui(self, state, trans):
         """Update UI"""
-        speed_kmh = state.speed * 3.6
-        self.speed_text.setText(f"Speed: {int(speed_kmh)} km/h")
-        self.rpm_text.setText(f"RPM: {int(state.engine_rpm)}")
+        last = self._ui_last
+
+        speed_kmh = int(state.speed * 3.6)
+        if speed_kmh != last[0]:
+            last[0] = speed_kmh
+            self.speed_text.setText(f"Speed: {speed_kmh} km/h")
+
+        rpm = int(state.engine_rpm)
+        if rpm != last[1]:
+            last[1] = rpm
+            self.rpm_text.setText(f"RPM: {rpm}")
         
         gear = trans.current_gear
-        gear_str = "N" if gear == 0 else ("R" if gear < 0 else str(gear))
-        self.gear_text.setText(f"Gear: {gear_str}")
+        if gear != last[2]:
+            last[2] = gear
+            gear_text = self._GEAR_TEXT.get(gear)
+            if gear_text is None:
+                gear_text = "Gear: R" if gear < 0 else f"Gear: {gear}"
+            self.gear_text.setText(gear_text)
     
     def exit_game(self):
         """Exit game"""
@@ -59,25 +59,34 @@ def _gaussian_filter_fallback(arr: np.ndarray, sigma: float) -> np.ndarray:
     radius = int(max(1.0, math.ceil(3.0 * sigma)))
     x = np.arange(-radius, radius + 1, dtype=np.float64)
     k = np.exp(-(x * x) / (2.0 * sigma * sigma))
-    k /= float(k.sum())
+    k = (k / k.sum()).astype(np.float32)
 
     def convolve1d_reflect(a: np.ndarray, kernel: np.ndarray, axis: int) -> np.ndarray:
         pad = kernel.size // 2
-        pads = [(0, 0)] * a.ndim
-        pads[axis] = (pad, pad)
-        ap = np.pad(a, pads, mode="reflect")
+        window_view = np.lib.stride_tricks.sliding_window_view
 
         # Move the convolving axis to the end for simpler slicing.
-        ap = np.moveaxis(ap, axis, -1)
-        out = np.empty(ap.shape[:-1] + (ap.shape[-1] - 2 * pad,), dtype=np.float64)
-        # Sliding window dot product; kernel sizes here are small (sigma is small).
-        for i in range(out.shape[-1]):
-            out[..., i] = np.tensordot(ap[..., i : i + kernel.size], kernel, axes=([-1], [0]))
-        out = np.moveaxis(out, -1, axis)
-        return out
-
-    a64 = arr.astype(np.float64, copy=False)
-    blurred = convolve1d_reflect(a64, k, axis=1)
+        a = np.moveaxis(a, axis, -1)
+        n = a.shape[-1]
+        edge_pads = [(0, 0)] * (a.ndim - 1)
+
+        if n <= 2 * pad:
+            # Tiny axis: windows overlap both edges, pad it whole.
+            ap = np.pad(a, edge_pads + [(pad, pad)], mode="reflect")
+            return np.moveaxis(window_view(ap, kernel.size, axis=-1) @ kernel, -1, axis)
+
+        # Sliding window dot product as one matmul over a strided view (no copy).
+        # Only the 2*pad wide edge strips are reflect-padded, never the full array.
+        out = np.empty(a.shape, dtype=np.result_type(a, kernel))
+        np.matmul(window_view(a, kernel.size, axis=-1), kernel, out=out[..., pad : n - pad])
+        head = np.pad(a[..., : 2 * pad], edge_pads + [(pad, 0)], mode="reflect")
+        tail = np.pad(a[..., n - 2 * pad :], edge_pads + [(0, pad)], mode="reflect")
+        np.matmul(window_view(head, kernel.size, axis=-1), kernel, out=out[..., :pad])
+        np.matmul(window_view(tail, kernel.size, axis=-1), kernel, out=out[..., n - pad :])
+        return np.moveaxis(out, -1, axis)
+
+    a32 = arr.astype(np.float32, copy=False)
+    blurred = convolve1d_reflect(a32, k, axis=1)
     blurred = convolve1d_reflect(blurred, k, axis=0)
     return blurred.astype(arr.dtype, copy=False)
 
@@ -126,7 +135,9 @@ def _normalize01(arr: np.ndarray) -> np.ndarray:
     high = float(arr.max())
     if math.isclose(low, high):
         return np.zeros_like(arr)
-    return (arr - low) / (high - low)
+    out = np.subtract(arr, low)
+    out /= high - low
+    return out
 
 
 def _build_fbm(
@@ -139,7 +150,7 @@ def _build_fbm(
     persistence: float,
     lacunarity: float,
 ) -> np.ndarray:
-    terrain = np.zeros((height, width), dtype=np.float64)
+    terrain = np.zeros((height, width), dtype=np.float32)
     amplitude = 1.0
     frequency = base_frequency
     amp_total = 0.0
@@ -150,37 +161,47 @@ def _build_fbm(
 
         ys = np.arange(height, dtype=np.float64)
         xs = np.arange(width, dtype=np.float64)
+        noise2array = getattr(simplex, "noise2array", None)
+        noise2 = simplex.noise2
 
         for _ in range(octaves):
             sample_x = xs * frequency
             sample_y = ys * frequency
 
-            if hasattr(simplex, "noise2array"):
-                layer = simplex.noise2array(sample_x, sample_y)
+            if noise2array is not None:
+                layer = noise2array(sample_x, sample_y)
             else:
-                xx, yy = np.meshgrid(sample_x, sample_y)
-                layer = np.vectorize(simplex.noise2)(xx, yy)
-
-            terrain += layer * amplitude
+                # Older opensimplex releases only expose the scalar call; walk
+                # plain float lists rather than materialising meshgrids for
+                # np.vectorize every octave.
+                row_x = sample_x.tolist()
+                layer = np.array(
+                    [[noise2(x, y) for x in row_x] for y in sample_y.tolist()],
+                    dtype=np.float32,
+                )
+
+            layer = layer.astype(np.float32, copy=False)
+            layer *= amplitude
+            terrain += layer
             amp_total += amplitude
             amplitude *= persistence
             frequency *= lacunarity
 
     elif generator_name == "noise":
         pnoise2 = _import_generator("noise")
+        xs = range(width)
 
         for octave in range(octaves):
-            layer = np.zeros_like(terrain)
             freq = base_frequency * (lacunarity ** octave)
             amp = persistence ** octave
 
+            # One list comprehension per row keeps the per-sample cost down to
+            # the pnoise2 call itself (no numpy scalar item assignment).
             for y in range(height):
                 fy = y * freq
-                for x in range(width):
-                    fx = x * freq
-                    layer[y, x] = pnoise2(fx, fy, repeatx=width, repeaty=height, base=seed)
+                row = [pnoise2(x * freq, fy, repeatx=width, repeaty=height, base=seed) for x in xs]
+                terrain[y] += np.asarray(row, dtype=np.float32) * np.float32(amp)
 
-            terrain += layer * amp
             amp_total += amp
 
     else:
@@ -192,9 +213,12 @@ def _build_fbm(
 
 
 def _compress_relief(heightmap: np.ndarray, relief_strength: float) -> np.ndarray:
-    center = float(heightmap.mean())
-    compressed = center + (heightmap - center) * relief_strength
-    return _normalize01(compressed)
+    # Scaling around the mean is affine, so for any positive strength the
+    # min/max normalisation that follows maps it straight back onto the
+    # normalised input; only a zero strength (fully flat) differs.
+    if relief_strength <= 0.0:
+        return np.zeros_like(heightmap)
+    return _normalize01(heightmap)
 
 
 def _read_track_points(path: str) -> List[Tuple[float, float]]:
@@ -235,30 +259,15 @@ def _to_pixel_points(
 
 
 def _draw_polyline(mask: np.ndarray, points: Sequence[Tuple[int, int]]) -> None:
-    def draw_line(x0: int, y0: int, x1: int, y1: int) -> None:
-        dx = abs(x1 - x0)
-        dy = -abs(y1 - y0)
-        sx = 1 if x0 < x1 else -1
-        sy = 1 if y0 < y1 else -1
-        err = dx + dy
-
-        x, y = x0, y0
-        while True:
-            mask[y, x] = True
-            if x == x1 and y == y1:
-                break
-            e2 = 2 * err
-            if e2 >= dy:
-                err += dy
-                x += sx
-            if e2 <= dx:
-                err += dx
-                y += sy
-
     for i in range(len(points) - 1):
         x0, y0 = points[i]
         x1, y1 = points[i + 1]
-        draw_line(x0, y0, x1, y1)
+        # One sample per pixel along the major axis; the mask only seeds the
+        # distance transform, so Bresenham-exact stepping is not needed.
+        n = max(abs(x1 - x0), abs(y1 - y0)) + 1
+        xs = np.linspace(x0, x1, n).round().astype(np.intp)
+        ys = np.linspace(y0, y1, n).round().astype(np.intp)
+        mask[ys, xs] = True
 
 
 def _apply_track_flatten(
@@ -287,25 +296,26 @@ def _apply_track_flatten(
 
     target = gaussian_filter(heightmap, sigma=max(1.0, corridor_width_px * 0.25))
 
-    inner = dist <= half_corridor
-    feather = (dist > half_corridor) & (dist < half_corridor + fade)
-
-    strength = np.zeros_like(heightmap, dtype=np.float64)
-    strength[inner] = flatten_strength
-    strength[feather] = flatten_strength * (
-        1.0 - (dist[feather] - half_corridor) / fade
-    )
+    # Full strength inside the corridor, linear falloff across the feather band,
+    # computed as one clipped ramp instead of masked scatters.
+    strength = np.subtract(half_corridor + fade, dist, dtype=np.float32)
+    strength /= fade
+    np.clip(strength, 0.0, 1.0, out=strength)
+    strength *= flatten_strength
 
     out = heightmap * (1.0 - strength) + target * strength
     return _normalize01(out)
 
 
 def _write_pgm16(path: str, data_01: np.ndarray) -> None:
-    data_u16 = np.clip(data_01 * 65535.0, 0, 65535).astype(np.uint16)
-    be = data_u16.byteswap()  # PGM binary stores big-endian for 16-bit
+    scaled = data_01 * 65535.0
+    np.clip(scaled, 0, 65535, out=scaled)
+    # PGM binary stores big-endian for 16-bit; cast straight to a C-ordered
+    # big-endian buffer so it can be written without another copy.
+    data_u16 = scaled.astype(">u2", order="C")
     with open(path, "wb") as f:
         f.write(f"P5\n{data_u16.shape[1]} {data_u16.shape[0]}\n65535\n".encode("ascii"))
-        f.write(be.tobytes())
+        f.write(memoryview(data_u16))
 
 
 def parse_args() -> argparse.Namespace:
@@ -410,7 +420,7 @@ def main() -> int:
     pgm_path = f"{base}.pgm"
     report_path = f"{base}.json"
 
-    np.save(npy_path, terrain.astype(np.float32))
+    np.save(npy_path, terrain.astype(np.float32, copy=False))
     _write_pgm16(pgm_path, terrain)
 
     report = {
@@ -4,9 +4,9 @@
 from dataclasses import dataclass, field
 from typing import List
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TireConfig:
-    """轮胎配置"""
+    """轮胎配置（只读；每帧按槽位读取）"""
     # 侧向刚度
     lat_stiff_max_load: float = 2.0    # 最大负载时的侧向刚度
     lat_stiff_value: float = 17.0      # 侧向刚度值
@@ -6,7 +6,6 @@ import math
 from .base_system import SystemBase
 from .update_context import SystemUpdateContext
 from ..data.suspension_state import WheelSuspensionState
-from ..data.vehicle_state import VehicleState
 from ..data.vehicle_state import Vector3
 
 class SuspensionSystem(SystemBase):
@@ -42,6 +41,23 @@ class SuspensionSystem(SystemBase):
         
         # 计算簧载质量
         self.sprung_masses = self._compute_sprung_masses()
+        
+        # 按字段预计算每个车轮的常量（只依赖配置和簧载质量）
+        gravity = 9.81
+        self._spring_stiffness = []
+        self._damper_rate = []
+        self._base_compression = []
+        self._max_compression = []
+        self._max_droop = []
+        for wheel_config, sprung_mass in zip(self.wheel_configs, self.sprung_masses):
+            natural_frequency = wheel_config.get('natural_frequency', self.default_natural_frequency)
+            damping_ratio = wheel_config.get('damping_ratio', self.default_damping_ratio)
+            spring_stiffness = (natural_frequency ** 2) * sprung_mass
+            self._spring_stiffness.append(spring_stiffness)
+            self._damper_rate.append(damping_ratio * 2.0 * math.sqrt(spring_stiffness * sprung_mass))
+            self._base_compression.append((sprung_mass * gravity) / spring_stiffness)
+            self._max_compression.append(wheel_config.get('max_compression', self.default_max_compression))
+            self._max_droop.append(wheel_config.get('max_droop', self.default_max_droop))
     
     def _compute_sprung_masses(self) -> list:
         """
@@ -92,36 +108,25 @@ class SuspensionSystem(SystemBase):
         
         if wheels_state is None or suspension_state is None:
             return
-        for i, config in enumerate(self.wheel_configs):
-            if i < len(suspension_state.wheels) and i < len(self.sprung_masses):
-                self._update_wheel_suspension(
-                    dt, config, self.sprung_masses[i],
-                    vehicle_state, wheels_state.wheels[i],
-                    suspension_state.wheels[i]
-                )
+        # 垂直加速度对所有车轮相同
+        vertical_accel = vehicle_state.acceleration.z if vehicle_state.acceleration else 0.0
+        for (wheel_state, suspension_wheel, sprung_mass, spring_stiffness, damper_rate,
+             base_compression, max_compression, max_droop) in zip(
+            wheels_state.wheels, suspension_state.wheels, self.sprung_masses,
+            self._spring_stiffness, self._damper_rate, self._base_compression,
+            self._max_compression, self._max_droop,
+        ):
+            self._update_wheel_suspension(
+                dt, sprung_mass, spring_stiffness, damper_rate, base_compression,
+                max_compression, max_droop, vertical_accel, wheel_state, suspension_wheel
+            )
     
-    def _update_wheel_suspension(self, dt: float, wheel_config: dict, sprung_mass: float,
-                                  vehicle_state: VehicleState, wheel_state, suspension_state: WheelSuspensionState):
-        """更新单个车轮的悬挂"""
-        # 获取悬挂参数
-        natural_frequency = wheel_config.get('natural_frequency', self.default_natural_frequency)
-        damping_ratio = wheel_config.get('damping_ratio', self.default_damping_ratio)
-        rest_length = wheel_config.get('rest_length', self.default_rest_length)
-        max_compression = wheel_config.get('max_compression', self.default_max_compression)
-        max_droop = wheel_config.get('max_droop', self.default_max_droop)
-        
-        # 1. 计算弹簧刚度
-        spring_stiffness = (natural_frequency ** 2) * sprung_mass
-        
-        # 2. 计算阻尼率
-        damper_rate = damping_ratio * 2.0 * math.sqrt(spring_stiffness * sprung_mass)
-        
-        # 3. 计算基础压缩（重力导致）
-        gravity = 9.81
-        base_compression = (sprung_mass * gravity) / spring_stiffness
-        
+    def _update_wheel_suspension(self, dt: float, sprung_mass: float, spring_stiffness: float,
+                                  damper_rate: float, base_compression: float,
+                                  max_compression: float, max_droop: float, vertical_accel: float,
+                                  wheel_state, suspension_state: WheelSuspensionState):
+        """更新单个车轮的悬挂（刚度、阻尼率和静态压缩已在初始化时预计算）"""
         # 4. 计算动态压缩（加速度导致）
-        vertical_accel = vehicle_state.acceleration.z if vehicle_state.acceleration else 0.0
         dynamic_compression = (sprung_mass * vertical_accel) / spring_stiffness
         
         # 5. 计算压缩速度影响
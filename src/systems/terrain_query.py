@@ -16,6 +16,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional, Protocol, runtime_checkable
 
+import numpy as np
+
 from ..data.vehicle_state import Vector3
 
 
@@ -112,6 +114,9 @@ class NullTerrainQuery:
             surface_type="default",
         )
 
+    def sample_heights(self, xs, ys) -> np.ndarray:
+        return np.zeros(np.shape(xs), dtype=np.float64)
+
     def get_world_bounds(self) -> tuple[float, float, float, float]:
         return (-10000.0, -10000.0, 10000.0, 10000.0)
 
@@ -130,18 +135,34 @@ class TerrainQueryAdapter:
             terrain: RuntimeTerrain or RuntimeMapBuilder instance
         """
         self._terrain = terrain
+        # RuntimeTerrain exposes a combined height+normal lookup and a
+        # vectorized height lookup; other implementations fall back to the
+        # per-point methods.
+        self._sample_height_and_normal = getattr(terrain, "sample_height_and_normal", None)
+        self._sample_heights = getattr(terrain, "sample_heights", None)
 
     def sample_height(self, x: float, y: float) -> float:
         return float(self._terrain.sample_height(x, y))
 
+    def sample_heights(self, xs, ys) -> np.ndarray:
+        """Sample heights for arrays of world X/Y (e.g. all wheels) in one call."""
+        if self._sample_heights is not None:
+            return self._sample_heights(xs, ys)
+        return np.array([self._terrain.sample_height(x, y) for x, y in zip(xs, ys)], dtype=np.float64)
+
     def sample_normal(self, x: float, y: float) -> Vector3:
         # RuntimeTerrain returns Vec3 from Panda3D
         n = self._terrain.sample_normal(x, y)
         return Vector3(float(n.x), float(n.y), float(n.z))
 
     def sample(self, x: float, y: float) -> TerrainSample:
-        height = self.sample_height(x, y)
-        normal = self.sample_normal(x, y)
+        if self._sample_height_and_normal is not None:
+            height, n = self._sample_height_and_normal(x, y)
+            height = float(height)
+            normal = Vector3(float(n.x), float(n.y), float(n.z))
+        else:
+            height = self.sample_height(x, y)
+            normal = self.sample_normal(x, y)
 
         # Future: could query surface type from texture/material
         # For now, return default values
@@ -28,6 +28,12 @@ class WheelSystem(SystemBase):
         else:
             self.wheel_configs = config.get('wheels', []) if config else []
         
+        # 按字段拆分的车轮参数（每帧不再查字典）
+        self._radii = [wc.get('radius', 0.35) for wc in self.wheel_configs]
+        self._can_steer = [wc.get('can_steer', False) for wc in self.wheel_configs]
+        self._is_driven = [wc.get('is_driven', False) for wc in self.wheel_configs]
+        self._local_positions = [wc.get('position', [0, 0, 0]) for wc in self.wheel_configs]
+        
         # 转向速度因子曲线
         if isinstance(config, dict):
             self.steering_speed_curve = config.get('steering_speed_curve', [
@@ -43,26 +49,19 @@ class WheelSystem(SystemBase):
         wheels_state = ctx.wheels_state
         if wheels_state is None:
             return
-        for i, wheel_config in enumerate(self.wheel_configs):
-            if i < len(wheels_state.wheels):
-                self._update_wheel(dt, vehicle_state, wheel_config, wheels_state.wheels[i])
-    
-    def _update_wheel(self, dt: float, vehicle_state: VehicleState,
-                      wheel_config: dict, wheel_state: WheelState):
-        """更新单个车轮"""
-        # 车轮参数
-        radius = wheel_config.get('radius', 0.35)
-        can_steer = wheel_config.get('can_steer', False)
-        is_driven = wheel_config.get('is_driven', False)
-        
-        # 1. 计算车轮旋转
-        self._update_wheel_rotation(dt, vehicle_state, wheel_state, radius, is_driven)
-        
-        # 2. 计算车轮转向
-        self._update_wheel_steering(vehicle_state, wheel_state, can_steer)
-        
-        # 3. 计算车轮位置
-        self._update_wheel_position(vehicle_state, wheel_state, wheel_config)
+        # 车身朝向对所有车轮相同，只算一次
+        heading_rad = math.radians(vehicle_state.heading)
+        cos_h = math.cos(heading_rad)
+        sin_h = math.sin(heading_rad)
+        for wheel_state, radius, can_steer, is_driven, local_pos in zip(
+            wheels_state.wheels, self._radii, self._can_steer, self._is_driven, self._local_positions
+        ):
+            # 1. 计算车轮旋转
+            self._update_wheel_rotation(dt, vehicle_state, wheel_state, radius, is_driven)
+            # 2. 计算车轮转向
+            self._update_wheel_steering(vehicle_state, wheel_state, can_steer)
+            # 3. 计算车轮位置
+            self._update_wheel_position(vehicle_state, wheel_state, local_pos, cos_h, sin_h)
     
     def _update_wheel_rotation(self, dt: float, vehicle_state: VehicleState,
                              wheel_state: WheelState, radius: float, is_driven: bool):
@@ -92,17 +91,11 @@ class WheelSystem(SystemBase):
             wheel_state.steering_angle = 0.0
     
     def _update_wheel_position(self, vehicle_state: VehicleState,
-                              wheel_state: WheelState, wheel_config: dict):
+                              wheel_state: WheelState, local_pos, cos_h: float, sin_h: float):
         """更新车轮位置"""
         # 车轮相对车身位置
-        local_pos = wheel_config.get('position', [0, 0, 0])
         wheel_state.local_position = Vector3.from_tuple(local_pos)
         
-        # 车轮世界位置
-        heading_rad = math.radians(vehicle_state.heading)
-        cos_h = math.cos(heading_rad)
-        sin_h = math.sin(heading_rad)
-        
         # 旋转变换
         wx = local_pos[0] * cos_h + local_pos[1] * sin_h
         wy = -local_pos[0] * sin_h + local_pos[1] * cos_h
@@ -368,8 +368,9 @@ class RuntimeTerrain:
         grid_x = u * (self.map_width - 1)
         grid_y = v * (self.map_height - 1)
 
-        x0 = int(np.floor(grid_x))
-        y0 = int(np.floor(grid_y))
+        # grid_x/grid_y are clamped non-negative, so int() truncation is floor().
+        x0 = int(grid_x)
+        y0 = int(grid_y)
         x1 = min(self.map_width - 1, x0 + 1)
         y1 = min(self.map_height - 1, y0 + 1)
 
@@ -387,6 +388,33 @@ class RuntimeTerrain:
 
         return self.config.base_height + float(h_norm) * self.config.height_scale
 
+    def sample_heights(self, world_x: np.ndarray, world_y: np.ndarray) -> np.ndarray:
+        """Vectorized `sample_height` for arrays of world X/Y coordinates."""
+        u = np.clip(np.asarray(world_x, dtype=np.float64) / float(self.config.world_size_x) + 0.5, 0.0, 1.0)
+        v = np.clip(np.asarray(world_y, dtype=np.float64) / float(self.config.world_size_y) + 0.5, 0.0, 1.0)
+
+        grid_x = u * (self.map_width - 1)
+        grid_y = v * (self.map_height - 1)
+
+        x0 = np.floor(grid_x).astype(np.intp)
+        y0 = np.floor(grid_y).astype(np.intp)
+        x1 = np.minimum(self.map_width - 1, x0 + 1)
+        y1 = np.minimum(self.map_height - 1, y0 + 1)
+
+        # Interpolate in the heightmap's dtype, like the scalar path does.
+        dtype = self.heightmap.dtype
+        tx = (grid_x - x0).astype(dtype)
+        ty = (grid_y - y0).astype(dtype)
+        sx = (1.0 - (grid_x - x0)).astype(dtype)
+        sy = (1.0 - (grid_y - y0)).astype(dtype)
+
+        hm = self.heightmap
+        top = hm[y0, x0] * sx + hm[y0, x1] * tx
+        bottom = hm[y1, x0] * sx + hm[y1, x1] * tx
+        h_norm = top * sy + bottom * ty
+
+        return self.config.base_height + h_norm.astype(np.float64) * self.config.height_scale
+
     def sample_normal(self, world_x: float, world_y: float) -> Vec3:
         """Estimate terrain normal in world coordinates."""
         eps_x = self.config.world_size_x / max(64, self.map_width - 1)
@@ -403,6 +431,49 @@ class RuntimeTerrain:
         normal.normalize()
         return normal
 
+    def sample_height_and_normal(self, world_x: float, world_y: float) -> tuple[float, Vec3]:
+        """Return `(sample_height, sample_normal)` for one point.
+
+        Same results as the two separate calls, but the five bilinear lookups
+        share one setup instead of going through five `sample_height` calls.
+        """
+        cfg = self.config
+        hm = self.heightmap
+        last_x = self.map_width - 1
+        last_y = self.map_height - 1
+        size_x = float(cfg.world_size_x)
+        size_y = float(cfg.world_size_y)
+        eps_x = cfg.world_size_x / max(64, last_x)
+        eps_y = cfg.world_size_y / max(64, last_y)
+
+        heights = []
+        for x, y in (
+            (world_x, world_y),
+            (world_x - eps_x, world_y),
+            (world_x + eps_x, world_y),
+            (world_x, world_y - eps_y),
+            (world_x, world_y + eps_y),
+        ):
+            grid_x = min(1.0, max(0.0, (float(x) / size_x) + 0.5)) * last_x
+            grid_y = min(1.0, max(0.0, (float(y) / size_y) + 0.5)) * last_y
+            x0 = int(grid_x)
+            y0 = int(grid_y)
+            x1 = min(last_x, x0 + 1)
+            y1 = min(last_y, y0 + 1)
+            tx = grid_x - x0
+            ty = grid_y - y0
+
+            top = hm[y0, x0] * (1.0 - tx) + hm[y0, x1] * tx
+            bottom = hm[y1, x0] * (1.0 - tx) + hm[y1, x1] * tx
+            heights.append(cfg.base_height + float(top * (1.0 - ty) + bottom * ty) * cfg.height_scale)
+
+        height, h_left, h_right, h_down, h_up = heights
+        normal = Vec3(h_left - h_right, h_down - h_up, 2.0 * max(eps_x, eps_y))
+        if normal.length_squared() < 1e-8:
+            return height, Vec3(0.0, 0.0, 1.0)
+        normal.normalize()
+        return height, normal
+
     def _resolve_path(self, path: str) -> Path:
         candidate = Path(path)
         if candidate.is_absolute():
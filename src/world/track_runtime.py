@@ -168,8 +168,10 @@ class RuntimeTrack:
         dist = 0.0
         prev_x = None
         prev_y = None
-        for x, y in points:
-            z = self.terrain.sample_height(x, y) + self.config.elevation_offset
+        # Sample the whole polyline in one vectorized terrain lookup.
+        heights = self.terrain.sample_heights([p[0] for p in points], [p[1] for p in points]).tolist()
+        for (x, y), h in zip(points, heights):
+            z = h + self.config.elevation_offset
             if prev_x is not None and prev_y is not None:
                 dx = x - prev_x
                 dy = y - prev_y